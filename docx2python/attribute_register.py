@@ -13,10 +13,10 @@ html tags.
 
 from __future__ import annotations
 
-import uuid
+import itertools
+import sys
 import warnings
-from enum import Enum
-from typing import TYPE_CHECKING, Callable, Iterator, NamedTuple
+from typing import TYPE_CHECKING, Callable, Final, NamedTuple
 
 from lxml import etree
 
@@ -27,6 +27,18 @@ if TYPE_CHECKING:
 # Examine and reformat html tags
 # ===============================================================================
 
+# Every element of a type shares the same tag string, so a document with tens of
+# thousands of elements will have only a few dozen distinct tags. Cache the
+# localname and prefixed tag for each. Only str tags are cached. Other tags (e.g.,
+# the tag of a comment) are rare, and every element with an invalid tag will raise
+# a warning. Cached localnames and prefixed tags are interned, as are the tag sets
+# they are tested against, so membership tests can match by identity.
+_LOCALNAME_CACHE: dict[str, str] = {}
+_PREFIXED_TAG_CACHE: dict[tuple[str | None, str], str] = {}
+
+# Numbers the unique localnames returned for invalid tags.
+_INVALID_TAG_COUNTER = itertools.count()
+
 
 def get_localname(elem: EtreeElement) -> str:
     """Return the localname of the element tag.
@@ -47,15 +59,26 @@ def get_localname(elem: EtreeElement) -> str:
     These will raise a ValueError when passed to `etree.QName`. If a file with tags
     like this is opened in Word and saved again, any element with a bad tag will be
     stripped. Docx2Python does the same thing.  For any tag that raises a ValueError
-    in `etree.QName`, this function will return a random string, and docx2python will
+    in `etree.QName`, this function will return a unique string, and docx2python will
     silently ignore the element with the bad tag.
+
+    A string tag from lxml is always well formed (`{uri}localname` or `localname`),
+    so string tags are split without `etree.QName`. Only other tags (e.g., the tag
+    of a comment is a function) are passed to `etree.QName` for validation. Lxml
+    tags are never str subclasses, so an exact type check is enough.
     """
+    tag = elem.tag
+    if type(tag) is str:
+        localname = _LOCALNAME_CACHE.get(tag)
+        if localname is None:
+            localname = sys.intern(tag.rpartition("}")[2])
+            _LOCALNAME_CACHE[tag] = localname
+        return localname
     try:
-        qname = etree.QName(elem.tag)
+        return etree.QName(tag).localname
     except ValueError:
-        warnings.warn(f"skipping invalid tag name '{elem.tag}'", stacklevel=2)
-        return f"FAILED-{uuid.uuid4()}"
-    return qname.localname
+        warnings.warn(f"skipping invalid tag name '{tag}'", stacklevel=2)
+        return f"FAILED-{next(_INVALID_TAG_COUNTER)}"
 
 
 def get_prefixed_tag(elem: EtreeElement) -> str:
@@ -89,7 +112,15 @@ def get_prefixed_tag(elem: EtreeElement) -> str:
     Docx2Python identifies such paragraphs by their matching "prefixed tag" names
     (`w:p`), not their full tag names.
     """
-    return f"{elem.prefix}:{get_localname(elem)}"
+    tag = elem.tag
+    if type(tag) is not str:
+        return sys.intern(f"{elem.prefix}:{get_localname(elem)}")
+    key = (elem.prefix, tag)
+    prefixed_tag = _PREFIXED_TAG_CACHE.get(key)
+    if prefixed_tag is None:
+        prefixed_tag = sys.intern(f"{elem.prefix}:{get_localname(elem)}")
+        _PREFIXED_TAG_CACHE[key] = prefixed_tag
+    return prefixed_tag
 
 
 # ===============================================================================
@@ -279,46 +310,64 @@ XML2HTML_FORMATTER = {
 # ===============================================================================
 
 
-class Tags(str, Enum):
-    """Tags that provoke some action in docx2python."""
-
-    BODY = "w:body"
-    BR = "w:br"
-    COMMENT_RANGE_END = "w:commentRangeEnd"
-    COMMENT_RANGE_START = "w:commentRangeStart"
-    DOCUMENT = "w:document"
-    ENDNOTE = "w:endnote"
-    ENDNOTE_REFERENCE = "w:endnoteReference"
-    FOOTNOTE = "w:footnote"
-    FOOTNOTE_REFERENCE = "w:footnoteReference"
-    FORM_CHECKBOX = "w:checkBox"
-    FORM_DDLIST = "w:ddList"  # drop-down form
-    HYPERLINK = "w:hyperlink"
-    IMAGE = "a:blip"
-    IMAGEDATA = "v:imagedata"
-    IMAGE_ALT = "wp:docPr"
-    MATH = "m:oMath"
-    PARAGRAPH = "w:p"
-    PAR_PROPERTIES = "w:pPr"
-    RUN = "w:r"
-    RUN_PROPERTIES = "w:rPr"
-    SDT = "w:sdt"
-    SDT_PROPERTIES = "w:sdtPr"
-    SYM = "w:sym"
-    TAB = "w:tab"
-    TABLE = "w:tbl"
-    TABLE_CELL = "w:tc"
-    TABLE_ROW = "w:tr"
-    TEXT = "w:t"
-    TEXT_MATH = "m:t"
-
-
-_CONTENT_TAGS = set(Tags) - {
+class Tags:
+    """Tags that provoke some action in docx2python.
+
+    Plain str class attributes (not Enum members) so that comparisons and hashing
+    stay on builtin str methods.
+    """
+
+    BODY: Final = "w:body"
+    BR: Final = "w:br"
+    COMMENT_RANGE_END: Final = "w:commentRangeEnd"
+    COMMENT_RANGE_START: Final = "w:commentRangeStart"
+    DOCUMENT: Final = "w:document"
+    ENDNOTE: Final = "w:endnote"
+    ENDNOTE_REFERENCE: Final = "w:endnoteReference"
+    FOOTNOTE: Final = "w:footnote"
+    FOOTNOTE_REFERENCE: Final = "w:footnoteReference"
+    FORM_CHECKBOX: Final = "w:checkBox"
+    FORM_DDLIST: Final = "w:ddList"  # drop-down form
+    HYPERLINK: Final = "w:hyperlink"
+    IMAGE: Final = "a:blip"
+    IMAGEDATA: Final = "v:imagedata"
+    IMAGE_ALT: Final = "wp:docPr"
+    MATH: Final = "m:oMath"
+    PARAGRAPH: Final = "w:p"
+    PAR_PROPERTIES: Final = "w:pPr"
+    RUN: Final = "w:r"
+    RUN_PROPERTIES: Final = "w:rPr"
+    SDT: Final = "w:sdt"
+    SDT_PROPERTIES: Final = "w:sdtPr"
+    SYM: Final = "w:sym"
+    TAB: Final = "w:tab"
+    TABLE: Final = "w:tbl"
+    TABLE_CELL: Final = "w:tc"
+    TABLE_ROW: Final = "w:tr"
+    TEXT: Final = "w:t"
+    TEXT_MATH: Final = "m:t"
+
+
+# Intern the Tags values once, here, so that every module comparing them against
+# the (interned) output of get_prefixed_tag gets the identity fast path.
+for _name, _value in list(vars(Tags).items()):
+    if _name.isupper():
+        setattr(Tags, _name, sys.intern(_value))
+del _name, _value
+
+# Tags values mapped to Tags attribute names, e.g., {"w:p": "PARAGRAPH", ...}
+TAG_NAMES: dict[str, str] = {v: k for k, v in vars(Tags).items() if k.isupper()}
+
+_CONTENT_TAGS = frozenset(TAG_NAMES) - {
     Tags.RUN_PROPERTIES,
     Tags.PAR_PROPERTIES,
     Tags.SDT_PROPERTIES,
 }
 
+# Content tags by localname in any namespace, e.g., `{*}p`. Passed to `iter`, these
+# let lxml skip (in C) any element that cannot be a content element.
+_CONTENT_LOCALNAMES = tuple(sorted({f"{{*}}{x.split(':')[1]}" for x in _CONTENT_TAGS}))
+
 
 def _is_content(elem: EtreeElement) -> bool:
     """Is the element a content element?
@@ -347,18 +396,14 @@ def has_content(tree: EtreeElement) -> str | None:
     ignored elements.
 
     If no content is found, the element can be safely ignored going forward.
-    """
-
-    def iter_content(tree_: EtreeElement) -> Iterator[str]:
-        """Yield all content elements in tree.
 
-        :param tree_: xml element
-        :yield: child content elements
-        :return: None
-        """
-        if _is_content(tree_):
-            yield tree_.tag
-        for branch in tree_:
-            yield from iter_content(branch)
-
-    return next(iter_content(tree), None)
+    `tree.iter()` walks the tree (starting with `tree` itself) in lxml's C code, so
+    there is no Python recursion here, and the search stops at the first content
+    element. Lxml only yields elements with a content-tag localname. These still
+    have to be checked for a content prefix (`w:`, `m:`, ...), but most elements
+    (properties, proofErr, bookmarks, ...) never reach Python.
+    """
+    for elem in tree.iter(*_CONTENT_LOCALNAMES):
+        if _is_content(elem):
+            return str(elem.tag)
+    return None
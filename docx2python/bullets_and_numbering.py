@@ -16,13 +16,12 @@ during the extraction.
 
 from __future__ import annotations
 
+import functools
 import warnings
 from collections import defaultdict
-from contextlib import suppress
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, NamedTuple
 
 from docx2python import numbering_formats as nums
-from docx2python.namespace import get_attrib_by_qn, iterfind_by_qn
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement  # type: ignore
@@ -30,6 +29,20 @@ if TYPE_CHECKING:
     from docx2python.docx_context import NumIdAttrs
 
 
+# The string nums.bullet returns for every bullet. Numbers (not bullets) are
+# followed by a parenthesis.
+_BULLET = nums.bullet()
+
+_NUMFMT2BULLET_FUNCTION: dict[str, Callable[[int], str]] = {
+    "decimal": nums.decimal,
+    "lowerLetter": nums.lower_letter,
+    "upperLetter": nums.upper_letter,
+    "lowerRoman": nums.lower_roman,
+    "upperRoman": nums.upper_roman,
+    "bullet": nums.bullet,
+}
+
+
 def _get_bullet_function(numFmt: str) -> Callable[[int], str]:
     """Select a bullet or numbering format function from xml numFmt.
 
@@ -37,25 +50,27 @@ def _get_bullet_function(numFmt: str) -> Callable[[int], str]:
     :return: a function that takes an int and returns a string. If numFmt is not
         recognized, treat numbers as bullets.
     """
-    numFmt2bullet_function: dict[str, Callable[[int], str]] = {
-        "decimal": nums.decimal,
-        "lowerLetter": nums.lower_letter,
-        "upperLetter": nums.upper_letter,
-        "lowerRoman": nums.lower_roman,
-        "upperRoman": nums.upper_roman,
-        "bullet": nums.bullet,
-    }
-    try:
-        retval_: Callable[[int], str] = numFmt2bullet_function[numFmt]
-    except KeyError:
+    bullet_function = _NUMFMT2BULLET_FUNCTION.get(numFmt)
+    if bullet_function is None:
         warnings.warn(
             f"{numFmt} numbering format not implemented, "
-            + f"substituting '{nums.bullet()}'",
+            + f"substituting '{_BULLET}'",
             stacklevel=2,
         )
         return nums.bullet
-    else:
-        return retval_
+    return bullet_function
+
+
+def _format_bullet(bullet: str, ilvl: int) -> str:
+    """Indent, format and pad the bullet or number string.
+
+    :param bullet: any kind of list-item string (bullet, number, Roman, ...)
+    :param ilvl: indentation level
+    :return: formatted bullet string
+    """
+    if bullet != _BULLET:
+        bullet += ")"
+    return "\t" * ilvl + bullet + "\t"
 
 
 def _new_list_counter() -> defaultdict[str, defaultdict[str, int]]:
@@ -68,7 +83,7 @@ def _new_list_counter() -> defaultdict[str, defaultdict[str, int]]:
 
     This is what you need to keep track of where every nested list is at.
     """
-    return defaultdict(lambda: defaultdict(int))
+    return defaultdict(functools.partial(defaultdict, int))
 
 
 def _increment_list_counter(ilvl2count: defaultdict[str, int], ilvl: str) -> int:
@@ -90,14 +105,55 @@ def _increment_list_counter(ilvl2count: defaultdict[str, int], ilvl: str) -> int
 
     List counters are defaultdicts, so we can reset sublist counters by deleting
     them.
+
+    Every increment deletes all deeper levels, so levels are always inserted in
+    ascending order, and any deeper levels are the last keys in the dict. Pop these
+    from the end instead of scanning every key.
     """
+    while ilvl2count and next(reversed(ilvl2count)) > ilvl:
+        _ = ilvl2count.popitem()
     ilvl2count[ilvl] += 1
-    deeper_levels = [k for k in ilvl2count if k > ilvl]
-    for level in deeper_levels:
-        del ilvl2count[level]
     return ilvl2count[ilvl]
 
 
+class _NumPrQNames(NamedTuple):
+    """Qualified names of numPr elements and attributes in one `w` namespace."""
+
+    numpr_path: str
+    num_id: str
+    ilvl: str
+    val: str
+
+
+# Qualified numPr names for each `w` namespace uri. There will usually be only one
+# (transitional or strict) per document.
+_URI2NUMPR_QNAMES: dict[str, _NumPrQNames] = {}
+
+
+def _get_numPr_qnames(paragraph: EtreeElement) -> _NumPrQNames | None:
+    """Get qualified numPr element and attribute names in a paragraph's namespace.
+
+    :param paragraph: <w:p> xml element
+    :return: qualified names or None if `w` is not in the paragraph nsmap
+
+    `qn` reads `elem.nsmap`, which lxml builds by walking up the tree. Read it once
+    per paragraph instead of once for each element and attribute name.
+    """
+    uri = paragraph.nsmap.get("w")
+    if uri is None:
+        return None
+    qnames = _URI2NUMPR_QNAMES.get(uri)
+    if qnames is None:
+        qnames = _NumPrQNames(
+            f"{{{uri}}}pPr/{{{uri}}}numPr",
+            f"{{{uri}}}numId",
+            f"{{{uri}}}ilvl",
+            f"{{{uri}}}val",
+        )
+        _URI2NUMPR_QNAMES[uri] = qnames
+    return qnames
+
+
 class BulletGenerator:
     """Keep track of list counters and generate bullet strings.
 
@@ -121,51 +177,55 @@ class BulletGenerator:
         self.numId2count = _new_list_counter()
 
         # Only increment the number of a paragraph if that paragraph has not been
-        # seen. See docstring for self._get_par_number.
-        self._par2par_number: dict[EtreeElement, int | None] = {}
-
-    def _get_numPr(self, paragraph: EtreeElement) -> EtreeElement | None:
+        # seen. See docstring for self._get_par_number. Lxml elements cannot be
+        # weakly referenced, so keep this small by holding numbered paragraphs only.
+        # Un-numbered paragraphs never increment a counter, so there is nothing to
+        # remember about them.
+        self._par2par_number: dict[EtreeElement, int] = {}
+
+    def _get_numPr(
+        self, paragraph: EtreeElement, qnames: _NumPrQNames
+    ) -> EtreeElement | None:
         """Get the parent element of the numId and ilvl elements.
 
         :param paragraph: <w:p> xml element
+        :param qnames: qualified names in the namespace of the paragraph
         :return: <w:numPr> xml element or None if this fails.
+
+        Search for `w:pPr/w:numPr` with one path, so lxml walks the paragraph
+        children in C and returns None (instead of raising) on the common case of
+        an un-numbered paragraph.
         """
-        try:
-            pPr = next(iterfind_by_qn(paragraph, "w:pPr"))
-            return next(iterfind_by_qn(pPr, "w:numPr"))
-        except (StopIteration, KeyError):
-            return None
+        return paragraph.find(qnames.numpr_path)
 
-    def _get_numId(self, numPr: EtreeElement) -> str | None:
-        """Get the numId for the paragraph.
+    def _get_numId_and_ilvl(
+        self, numPr: EtreeElement, qnames: _NumPrQNames
+    ) -> tuple[str | None, str | None]:
+        """Get the numId and ilvl for the paragraph.
 
         :param numPr: <w:numPr> xml element (see class docstring)
-        :return: numId as a string or None if this fails.
+        :param qnames: qualified names in the namespace of the paragraph
+        :return: numId and ilvl as strings. Either may be None if this fails.
 
         The numId is an integer (string of an integer) index to a list of multi-level
         list formats. For each numId, there is a list of formats for each indentation
         level.
-        """
-        try:
-            numId_element = next(iterfind_by_qn(numPr, "w:numId"))
-            return get_attrib_by_qn(numId_element, "w:val")
-        except (StopIteration, KeyError):
-            return None
-
-    def _get_ilvl(self, numPr: EtreeElement) -> str | None:
-        """Get the ilvl for the paragraph.
-
-        :param numPr: <w:numPr> xml element (see class docstring)
-        :return: ilvl as a string or None if this fails.
 
         The ilvl is an integer (string of an integer) index of a multi-level list
         formats. For each ilvl, there is a format.
+
+        Find the first of each in one pass over the numPr children.
         """
-        try:
-            ilvl_element = next(iterfind_by_qn(numPr, "w:ilvl"))
-            return get_attrib_by_qn(ilvl_element, "w:val")
-        except (StopIteration, KeyError):
-            return None
+        numId_element: EtreeElement | None = None
+        ilvl_element: EtreeElement | None = None
+        for child in numPr:
+            if numId_element is None and child.tag == qnames.num_id:
+                numId_element = child
+            elif ilvl_element is None and child.tag == qnames.ilvl:
+                ilvl_element = child
+        numId = None if numId_element is None else numId_element.get(qnames.val)
+        ilvl = None if ilvl_element is None else ilvl_element.get(qnames.val)
+        return numId, ilvl
 
     def get_bullet_fmt(self, paragraph: EtreeElement) -> tuple[str | None, str | None]:
         """Expose the numId and ilvl of a numbered paragraph.
@@ -175,14 +235,13 @@ class BulletGenerator:
 
         This will return None, None, None if the paragraph is not numbered.
         """
-        numPr = self._get_numPr(paragraph)
+        qnames = _get_numPr_qnames(paragraph)
+        if qnames is None:
+            return None, None
+        numPr = self._get_numPr(paragraph, qnames)
         if numPr is None:
             return None, None
-        numId = self._get_numId(numPr)
-        ilvl = self._get_ilvl(numPr)
-        if numId is None or ilvl is None:
-            return numId, ilvl
-        return numId, ilvl
+        return self._get_numId_and_ilvl(numPr, qnames)
 
     def get_par_number(self, paragraph: EtreeElement) -> int | None:
         """Get the number (at the current indentation level) of a paragraph.
@@ -204,14 +263,14 @@ class BulletGenerator:
         numId and ilvl should both be defined for a numbered paragraph, but I'm
         testing both here to fail silently if that assumption is wrong.
         """
-        with suppress(KeyError):
-            return self._par2par_number[paragraph]
+        par_number = self._par2par_number.get(paragraph)
+        if par_number is not None:
+            return par_number
         numId, ilvl = self.get_bullet_fmt(paragraph)
         if numId is None or ilvl is None:
-            par_number = None
-        else:
-            counter = _increment_list_counter(self.numId2count[numId], ilvl)
-            par_number = counter + self.get_start_value_zero_based(numId, ilvl)
+            return None
+        counter = _increment_list_counter(self.numId2count[numId], ilvl)
+        par_number = counter + self.get_start_value_zero_based(numId, ilvl)
         self._par2par_number[paragraph] = par_number
         return par_number
 
@@ -275,19 +334,8 @@ class BulletGenerator:
             return ""
         attrs = self.__get_num_fmt_attributes(numId, ilvl)
         numFmt = attrs.fmt if attrs and attrs.fmt else "bullet"
-
-        def format_bullet(bullet: str) -> str:
-            """Indent, format and pad the bullet or number string.
-
-            :param bullet: any kind of list-item string (bullet, number, Roman, ...)
-            :return: formatted bullet string
-            """
-            if bullet != nums.bullet():
-                bullet += ")"
-            return "\t" * int(ilvl) + bullet + "\t"
-
         get_unformatted_bullet_str = _get_bullet_function(numFmt)
-        return format_bullet(get_unformatted_bullet_str(number))
+        return _format_bullet(get_unformatted_bullet_str(number), int(ilvl))
 
     def __get_num_fmt_attributes(
         self, numId: str | None, ilvl: str | None
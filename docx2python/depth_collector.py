@@ -32,11 +32,11 @@ Pass out of package with depth_collector_instance.tree.
 from __future__ import annotations
 
 import dataclasses
-import itertools as it
-from typing import TYPE_CHECKING, Any, Iterator, List, Literal, Tuple, Union, cast
+import functools
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, List, Literal, Tuple, Union, cast
 
 from docx2python.attribute_register import get_localname
-from docx2python.iterators import enum_at_depth
 from docx2python.text_runs import (
     get_paragraph_formatting,
     get_pStyle,
@@ -51,11 +51,40 @@ if TYPE_CHECKING:
     from docx2python.docx_reader import File
 
 
+# A document may have tens of thousands of runs. Where available (Python 3.10+),
+# slots keep Run and Par instances small and speed attribute access.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 _MaybeStr = Union[str, None]
 _Lineage = Tuple[Literal["document"], _MaybeStr, _MaybeStr, _MaybeStr, _MaybeStr]
 
+# lineage of paragraphs created outside the tree walk (e.g., merged cells)
+_EMPTY_LINEAGE: _Lineage = ("document", "", "", "", "")
+
+
+# Runs and paragraphs in a document share a few distinct styles, and every run is
+# stringified at least once, so cache the html tags for each style.
+@functools.lru_cache(maxsize=1024)
+def _html_open(style: tuple[str, ...]) -> str:
+    """Cache html_open results by style.
+
+    :param style: tuple of html tags without the '<' and '>'
+    :return: opening html tags joined into a single string
+    """
+    return html_open(style)
+
+
+@functools.lru_cache(maxsize=1024)
+def _html_close(style: tuple[str, ...]) -> str:
+    """Cache html_close results by style.
 
-@dataclasses.dataclass
+    :param style: tuple of html tags without the '<' and '>'
+    :return: closing html tags joined into a single string
+    """
+    return html_close(style)
+
+
+@dataclasses.dataclass(**_SLOTS)
 class Run:
     """A text run. Html styles and text content."""
 
@@ -67,12 +96,15 @@ class Run:
 
         :return: text content or "" if none
         """
-        if self.text:
-            return html_open(self.html_style) + self.text + html_close(self.html_style)
-        return ""
+        if not self.text:
+            return ""
+        if not self.html_style:
+            return self.text
+        style = tuple(self.html_style)
+        return _html_open(style) + self.text + _html_close(style)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(**_SLOTS)
 class Par:
     """A text paragraph. Html styles and a list of run strings.
 
@@ -103,13 +135,13 @@ class Par:
 
         :return: a string for each run with text content
         """
-        runs_as_text = [x for x in (str(y) for y in self.runs) if x]
+        if not self.runs and not self.html_style:
+            return []
+        # str(run) is empty exactly when run.text is empty
+        runs_as_text = [str(x) for x in self.runs if x.text]
         if self.html_style:
-            return [
-                html_open(self.html_style),
-                *runs_as_text,
-                html_close(self.html_style),
-            ]
+            style = tuple(self.html_style)
+            return [_html_open(style), *runs_as_text, _html_close(style)]
         return runs_as_text
 
     @classmethod
@@ -119,8 +151,7 @@ class Par:
         :param elem: the paragraph element
         :return: a new empty paragraph
         """
-        lineage: _Lineage = ("document", "", "", "", "")
-        return cls(elem, [], "", lineage, [])
+        return cls(elem, [], "", _EMPTY_LINEAGE, [])
 
 
 ParsTable = List[List[List[List[Par]]]]
@@ -134,17 +165,25 @@ def get_par_strings(nested_pars: ParsTable) -> TextTable:
         the DepthCollector's tables list [[[[Par]]]]
     :return: a list of strings from the runs [[[[[str]]]]]
     """
-    as_run_strings_lists: TextTable = []
-    for tbl in nested_pars:
-        as_run_strings_lists.append([])
-        for row in tbl:
-            as_run_strings_lists[-1].append([])
-            for cell in row:
-                as_run_strings_lists[-1][-1].append([])
-                for par in cell:
-                    as_run_strings_lists[-1][-1][-1].append(par.run_strings)
+    return [
+        [[[par.run_strings for par in cell] for cell in row] for row in tbl]
+        for tbl in nested_pars
+    ]
+
 
-    return as_run_strings_lists
+def _count_run_strings(pars: Iterable[Par]) -> int:
+    """Count the non-empty run strings in a sequence of paragraphs.
+
+    :param pars: Par instances
+    :return: number of strings these paragraphs would contribute to a TextTable
+
+    Count without building the strings. Each run with text is one string, and a
+    paragraph with an html style adds an opening and a closing string.
+    """
+    return sum(
+        sum(1 for r in par.runs if r.text) + (2 if par.html_style else 0)
+        for par in pars
+    )
 
 
 class CaretDepthError(Exception):
@@ -164,36 +203,53 @@ class DepthCollector:
         self._xml2html_format = file.context.xml2html_format
         self._par_depth: Literal[1, 2, 3, 4] = 4
 
-        self._lineage: _Lineage = ("document", None, None, None, None)
+        # Updated in place as the caret moves. Each Par gets a tuple snapshot.
+        self._lineage: list[str | None] = ["document", None, None, None, None]
         self._rightmost_branches: list[Any] = [[]]
+        # len(self._rightmost_branches), kept in step by set_caret
+        self._caret_depth = 1
 
         self._open_pars: list[Par] = []
         self.queued_runs: list[Run] = []
 
+        # the last run in the current paragraph, if known, and the style of a run
+        # that has been ended but not yet created. See _open_run.
+        self._current_run: Run | None = None
+        self._pending_style: list[str] | None = None
+        # (_current_run, _pending_style) of each paragraph with a nested paragraph
+        # (e.g., in a textbox) open inside it. Restored when the nested one closes.
+        self._suspended_run_states: list[tuple[Run | None, list[str] | None]] = []
+
         self.comment_ranges: dict[str, tuple[int, int]] = {}
 
+        # run strings in concluded paragraphs. See _count_runs.
+        self._run_count = 0
+
     def _set_in_lineage(self, index: Literal[1, 2, 3, 4], value: str | None):
-        """Set a value in the lineage tuple."""
-        prev = self._lineage[1:index]
-        aftr = self._lineage[index + 1 :]
-        tbl, row, cell, par = it.chain(prev, [value], aftr)
-        self._lineage = ("document", tbl, row, cell, par)
+        """Set a value in the lineage."""
+        self._lineage[index] = value
 
-    @property
-    def _runs_so_far(self) -> Iterator[str]:
-        """Return all runs seen so far.
+    def _count_runs(self) -> int:
+        """Count the number of runs seen so far in current and previous paragraphs.
 
         This is to mark the beginning and end of comment ranges.
+
+        Concluded paragraphs do not change, so their run strings are counted once
+        (in conclude_paragraph) and kept in a running total. Only the open
+        paragraphs are counted here.
         """
-        for run_text in enum_at_depth(self.tree_text, 5):
-            if run_text:
-                yield cast(str, run_text)
-        for par in self._open_pars:
-            yield from par.run_strings
+        return self._run_count + _count_run_strings(self._open_pars)
 
-    def _count_runs(self) -> int:
-        """Count the number of runs seen so far in current and previous paragraphs."""
-        return len(list(self._runs_so_far))
+    def count_merged_cell(self, new_cell: list[Par], old_cell: list[Par]) -> None:
+        """Update the run count when a merged cell is copied into the tree.
+
+        :param new_cell: the cell inserted into the tree
+        :param old_cell: the cell replaced in the tree (empty list if none)
+
+        TagRunner copies the content of vertically and horizontally merged cells
+        into the tree after the paragraphs in those cells have been concluded.
+        """
+        self._run_count += _count_run_strings(new_cell) - _count_run_strings(old_cell)
 
     def start_comment_range(self, id_: str) -> None:
         """Start a comment range at the given address.
@@ -212,15 +268,6 @@ class DepthCollector:
         beg = self.comment_ranges[id_][0]
         self.comment_ranges[id_] = (beg, cruns)
 
-    @staticmethod
-    def _get_run_strings(runs: list[Run]) -> list[str]:
-        """Return a string for each run in the current open paragraph. Ignore "".
-
-        :param runs: list of runs
-        :return: a string for each run with text content
-        """
-        return [x for x in (str(x) for x in runs) if x]
-
     def commence_paragraph(self, elem: EtreeElement | None = None) -> Par:
         """Gather any cached runs and open a new paragraph.
 
@@ -237,9 +284,15 @@ class DepthCollector:
         if elem is not None:
             pStyle = get_pStyle(elem)
 
-        new_par = Par(elem, html_style, pStyle, self._lineage, [*self.queued_runs])
+        # hand the queued runs list itself to the new paragraph
+        lineage = cast(_Lineage, tuple(self._lineage))
+        new_par = Par(elem, html_style, pStyle, lineage, self.queued_runs)
         self.queued_runs = []
+        if self._open_pars:
+            self._suspended_run_states.append((self._current_run, self._pending_style))
         self._open_pars.append(new_par)
+        self._current_run = None
+        self._pending_style = None
         return new_par
 
     def conclude_paragraph(self) -> None:
@@ -248,8 +301,14 @@ class DepthCollector:
             old_par = self._open_pars.pop()
         except IndexError:
             return
+        if self._open_pars:
+            self._current_run, self._pending_style = self._suspended_run_states.pop()
+        else:
+            self._current_run = None
+            self._pending_style = None
         self.set_caret(self._par_depth)
         self._rightmost_branches[-1].append(old_par)
+        self._run_count += _count_run_strings([old_par])
 
     def commence_run(self, elem: EtreeElement | None = None) -> None:
         """Open a new run and add it to the current paragraph.
@@ -260,11 +319,23 @@ class DepthCollector:
         if elem is not None:
             html_style = get_run_formatting(elem, self._xml2html_format)
         html_style = html_style or []
-        self._open_runs.append(Run(html_style or []))
+        new_run = Run(html_style or [])
+        self._open_runs.append(new_run)
+        self._current_run = new_run
+        self._pending_style = None
 
     def conclude_run(self) -> None:
-        """Close the current run and add it to the current paragraph."""
-        self.commence_run()
+        """Close the current run and add it to the current paragraph.
+
+        Any text found after this (and before the next run) will go into a new,
+        unstyled run. Most runs are followed by another run or by the end of the
+        paragraph, so only create that run (in _open_run) if text arrives.
+        """
+        if not self._open_pars:
+            self.commence_run()
+            return
+        self._current_run = None
+        self._pending_style = []
 
     @property
     def tree(self) -> ParsTable:
@@ -289,7 +360,7 @@ class DepthCollector:
         :return: from 0 to _par_depth, the depth of the last-closed element in the
             tree.
         """
-        return cast(Literal[1, 2, 3, 4], len(self._rightmost_branches))
+        return cast(Literal[1, 2, 3, 4], self._caret_depth)
 
     @property
     def _open_runs(self) -> list[Run]:
@@ -311,10 +382,18 @@ class DepthCollector:
         text anywhere in the tree, including starting from a text element. In those
         cases, silently create a new run. This will never occur when working from the
         top of a tree.
+
+        Every text element looks for this run, so it is kept in self._current_run
+        and only looked up again after a paragraph is opened or closed or a run is
+        concluded.
         """
-        if not self._open_runs:
-            self._open_runs.append(Run())
-        return self._open_runs[-1]
+        if self._current_run is None:
+            open_runs = self._open_runs
+            if self._pending_style is not None or not open_runs:
+                open_runs.append(Run(self._pending_style or []))
+                self._pending_style = None
+            self._current_run = open_runs[-1]
+        return self._current_run
 
     @property
     def _open_par(self) -> Par:
@@ -333,28 +412,6 @@ class DepthCollector:
             return self.commence_paragraph()
         return self._open_pars[-1]
 
-    def _drop_caret(self) -> None:
-        """Create a new branch under caret.
-
-        :raise CaretDepthError: if caret is already at the maximum depth
-        :return: None
-        """
-        if self.caret_depth >= self._par_depth:
-            msg = "will not drop caret beneath paragraph depth"
-            raise CaretDepthError(msg)
-        self._rightmost_branches[-1].append([])
-        self._rightmost_branches.append(self._rightmost_branches[-1][-1])
-
-    def _raise_caret(self) -> None:
-        """Close branch at caret and move up to parent.
-
-        :raise CaretDepthError: if there is no outside list to which to ascend
-        """
-        if self.caret_depth == 1:
-            msg = "will not raise caret above root"
-            raise CaretDepthError(msg)
-        self._rightmost_branches = self._rightmost_branches[:-1]
-
     def set_caret(
         self, depth: None | Literal[1, 2, 3, 4], elem: EtreeElement | None = None
     ) -> None:
@@ -365,19 +422,28 @@ class DepthCollector:
             merged into one paragraph. You'll want this true for every element except
             text runs. :depth: == None means the element (perhaps ``body``) does not
             effect depth (see details in docx_text._get_elem_depth).
+        :raise CaretDepthError: if depth is outside 1 .. paragraph depth
         """
         if depth is None:
             return
-        if self.caret_depth == depth:
-            lineage_at = None if elem is None else get_localname(elem)
-            self._set_in_lineage(depth, lineage_at)
-            return
-        if self.caret_depth < depth:
-            self._drop_caret()
-        elif self.caret_depth > depth:
-            self._set_in_lineage(depth, None)
-            self._raise_caret()
-        self.set_caret(depth, elem)
+        # checked once here, so the caret cannot move outside 1 .. _par_depth below
+        if depth > self._par_depth:
+            msg = "will not drop caret beneath paragraph depth"
+            raise CaretDepthError(msg)
+        if depth < 1:
+            msg = "will not raise caret above root"
+            raise CaretDepthError(msg)
+        branches = self._rightmost_branches
+        while self._caret_depth < depth:
+            new_branch: list[Any] = []
+            branches[-1].append(new_branch)
+            branches.append(new_branch)
+            self._caret_depth += 1
+        if self._caret_depth > depth:
+            del branches[depth:]
+            self._caret_depth = depth
+        lineage_at = None if elem is None else get_localname(elem)
+        self._set_in_lineage(depth, lineage_at)
 
     def add_text_into_open_run(self, item: str) -> None:
         """Add item into previous run.
@@ -387,18 +453,21 @@ class DepthCollector:
         This is for formatting tags and other text that appears between run tags. All
         entries to ``add_text_into_open_run`` will be merged together.
         """
-        if self._xml2html_format:
+        if self._xml2html_format and ("&" in item or "<" in item or ">" in item):
             item = item.replace("&", "&amp;")
             item = item.replace("<", "&lt;")
             item = item.replace(">", "&gt;")
-        self._open_run.text += item
+        # skip the _open_run property when the open run is already known
+        run = self._current_run or self._open_run
+        run.text += item
 
     def add_code_into_open_run(self, item: str) -> None:
         """Add text into previous run without escaping symbols.
 
         :param item: string to insert into previous run
         """
-        self._open_run.text += item
+        run = self._current_run or self._open_run
+        run.text += item
 
     def insert_text_as_new_run(self, item: str) -> None:
         """Close previous run, cache style, open & close new run, re-open cached style.
@@ -420,10 +489,17 @@ class DepthCollector:
             <run><b>some text</b></run>  # close this open run
             <run><a href="">link</a></run>  # add link as a new run
             <run><b>  # open a new run with the same style as the aborted first run
+
+        That last run is only created (in _open_run) if text arrives before the
+        next run or the end of the paragraph.
         """
-        open_style = self._open_run.html_style
+        if self._current_run is None and self._pending_style is not None:
+            open_style = self._pending_style
+        else:
+            open_style = self._open_run.html_style
         self._open_runs.append(Run([], item))
-        self._open_runs.append(Run(open_style))
+        self._current_run = None
+        self._pending_style = open_style
 
     def queue_run_for_next_paragraph(self, text: str) -> None:
         """Cache a run for the next paragraph.
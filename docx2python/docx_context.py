@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 from lxml import etree
 
 from docx2python.attribute_register import get_localname
-from docx2python.namespace import find_by_qn, findall_by_qn, get_attrib_by_qn
+from docx2python.namespace import qn
 
 if TYPE_CHECKING:
     import zipfile
@@ -73,32 +73,42 @@ def collect_numAttrs(numFmts_root: EtreeElement) -> dict[str, list[NumIdAttrs]]:
             "2": ...
         }
     """
+    # Resolve each qualified name once. qn rebuilds the element nsmap on every call,
+    # and numbering.xml may hold thousands of elements under the same namespace.
+    qn_abstractNum = qn(numFmts_root, "w:abstractNum")
+    qn_abstractNumId = qn(numFmts_root, "w:abstractNumId")
+    qn_lvl = qn(numFmts_root, "w:lvl")
+    qn_numFmt = qn(numFmts_root, "w:numFmt")
+    qn_start = qn(numFmts_root, "w:start")
+    qn_val = qn(numFmts_root, "w:val")
+    qn_num = qn(numFmts_root, "w:num")
+    qn_numId = qn(numFmts_root, "w:numId")
+
     abstractNumId2Attrs: dict[str, list[NumIdAttrs]] = {}
 
-    for abstractNum in findall_by_qn(numFmts_root, "w:abstractNum"):
-        id_ = str(get_attrib_by_qn(abstractNum, "w:abstractNumId"))
+    for abstractNum in numFmts_root.iterchildren(qn_abstractNum):
+        id_ = str(abstractNum.attrib[qn_abstractNumId])
 
         abstractNumId2Attrs[id_] = []
-        for lvl in findall_by_qn(abstractNum, "w:lvl"):
-            numFmtEl = find_by_qn(lvl, "w:numFmt")
+        for lvl in abstractNum.iterchildren(qn_lvl):
+            numFmtEl = lvl.find(qn_numFmt)
             fmt = None
             if numFmtEl is not None:
-                fmt = str(get_attrib_by_qn(numFmtEl, "w:val"))
-            startEl = find_by_qn(lvl, "w:start")
+                fmt = str(numFmtEl.attrib[qn_val])
+            startEl = lvl.find(qn_start)
             start = None
             if startEl is not None:
-                qn = get_attrib_by_qn(startEl, "w:val")
-                start = int(qn)
+                start = int(startEl.attrib[qn_val])
             abstractNumId2Attrs[id_].append(NumIdAttrs(fmt=fmt, start=start))
 
     numId2attrs: dict[str, list[NumIdAttrs]] = {}
     num: EtreeElement
-    for num in findall_by_qn(numFmts_root, "w:num"):
-        numId = get_attrib_by_qn(num, "w:numId")
-        abstractNumId = find_by_qn(num, "w:abstractNumId")
+    for num in numFmts_root.iterchildren(qn_num):
+        numId = num.attrib[qn_numId]
+        abstractNumId = num.find(qn_abstractNumId)
         if abstractNumId is None:
             continue
-        abstractNumIdval = get_attrib_by_qn(abstractNumId, "w:val")
+        abstractNumIdval = abstractNumId.attrib[qn_val]
         numId2attrs[str(numId)] = abstractNumId2Attrs[str(abstractNumIdval)]
 
     return numId2attrs
@@ -170,10 +180,7 @@ def collect_rels(zipf: zipfile.ZipFile) -> dict[str, list[dict[str, str]]]:
     """
     path2rels: dict[str, list[dict[str, str]]] = {}
     for rels in (x for x in zipf.namelist() if x[-5:] == ".rels"):
-        path2rels[rels] = [
-            {str(y): str(z) for y, z in x.attrib.items()}
-            for x in etree.fromstring(zipf.read(rels))
-        ]
+        path2rels[rels] = [dict(x.attrib) for x in etree.fromstring(zipf.read(rels))]
     return path2rels
 
 
@@ -21,10 +21,10 @@ instances and decodes shared non-content in a docx file structure.
 from __future__ import annotations
 
 import copy
-import os
 import zipfile
 from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from operator import attrgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, List
@@ -43,6 +43,7 @@ ParsTable = List[List[List[List[depth_collector.Par]]]]
 TextTable = List[List[List[List[List[str]]]]]
 
 if TYPE_CHECKING:
+    import os
     from io import BytesIO
     from types import TracebackType
 
@@ -53,6 +54,54 @@ if TYPE_CHECKING:
 CONTENT_FILE_TYPES = {"officeDocument", "header", "footer", "footnotes", "endnotes"}
 
 
+@lru_cache(maxsize=256)
+def _infer_path(dir_: str, target: str) -> str:
+    """Infer path/to/xml/file from a rels directory and a rels Target.
+
+    :param dir_: directory of the rels file, e.g., 'word/_rels'
+    :param target: Target attribute of a Relationship, e.g., 'header1.xml'
+    :return: path to the target inside the docx archive, e.g., 'word/header1.xml'
+
+    Paths inside a zip archive are always separated by '/', so split them with
+    ``str.rpartition`` instead of ``os.path`` or ``pathlib``. Only the name of the
+    parent directory of each argument is used.
+
+    Collapse empty and ``.`` segments the way ``pathlib`` would. These turn up in
+    external targets (e.g., hyperlinks), which are urls, not archive paths, and in
+    relative targets like ``./media/image1.png``.
+
+    Every File instance in a docx is built from the same handful of rels
+    directories, and the same Targets recur across rels files, so results are
+    cached. The cache is bounded, so it will not grow across documents.
+    """
+    if (
+        "//" in target
+        or "/." in target
+        or target.startswith(".")
+        or target.endswith("/")
+    ):
+        target = "/".join(s for s in target.split("/") if s not in ("", "."))
+    dir_parent = dir_.rpartition("/")[0].rpartition("/")[2]
+    target_dir, _, filename = target.rpartition("/")
+    target_parent = target_dir.rpartition("/")[2]
+    if dir_parent and target_parent:
+        return f"{dir_parent}/{target_parent}/{filename}"
+    return f"{dir_parent or target_parent}/{filename}"
+
+
+@lru_cache(maxsize=256)
+def _infer_rels_path(path: str) -> str:
+    """Infer path/to/rels from the path to an xml file.
+
+    :param path: path to an xml file inside the docx archive, e.g., 'word/header1.xml'
+    :return: path to the rels file for that xml file (which may not exist),
+        e.g., 'word/_rels/header1.xml.rels'
+    """
+    dirname, sep, filename = path.rpartition("/")
+    # keep the root of a rooted path, as os.path.split would: '/a.xml' -> '/'
+    return f"{dirname or sep}/_rels/{filename}.rels"
+
+
 @dataclass
 class File:
     """The attribute dict of a file in the docx, plus cached data.
@@ -84,7 +133,7 @@ class File:
         """
         self.context = context
         self.Id = str(attribute_dict["Id"])
-        self.Type = Path(attribute_dict["Type"]).name
+        self.Type = attribute_dict["Type"].rpartition("/")[2]
         self.Target = attribute_dict["Target"]
         self.dir = attribute_dict["dir"]
 
@@ -126,11 +175,7 @@ class File:
         """
         if self.__path is not None:
             return self.__path
-
-        dirs = [Path(x).parent.name for x in (self.dir, self.Target)]
-        dirname = "/".join([x for x in dirs if x])
-        filename = Path(self.Target).name
-        self.__path = f"{dirname}/{filename}"
+        self.__path = _infer_path(self.dir, self.Target)
         return self.__path
 
     @property
@@ -158,8 +203,7 @@ class File:
         """
         if self.__rels_path is not None:
             return self.__rels_path
-        dirname, filename = os.path.split(self.path)
-        self.__rels_path = "/".join([dirname, "_rels", filename + ".rels"])
+        self.__rels_path = _infer_rels_path(self.path)
         return self.__rels_path
 
     @property
@@ -363,7 +407,7 @@ class DocxReader:
 
         files: list[File] = []
         for k, v in collect_rels(self.zipf).items():
-            dir_ = str(Path(k).parent)
+            dir_ = k.rpartition("/")[0]
             files += [File(self, {**x, "dir": dir_}) for x in v]
         self.__files = files
         return self.__files
@@ -435,7 +479,7 @@ class DocxReader:
         """
         types = CONTENT_FILE_TYPES if type_ is None else {type_}
         return sorted(
-            (x for x in self.files if x.Type in types), key=attrgetter("path")
+            [x for x in self.files if x.Type in types], key=attrgetter("path")
         )
 
     def content_files(self) -> list[File]:
@@ -479,7 +523,7 @@ class DocxReader:
         images: dict[str, bytes] = {}
         for image in self.files_of_type("image"):
             with suppress(KeyError):
-                images[Path(image.Target).name] = self.zipf.read(image.path)
+                images[image.Target.rpartition("/")[2]] = self.zipf.read(image.path)
         if image_directory is not None:
             image_directory = Path(image_directory)
             image_directory.mkdir(parents=True, exist_ok=True)
@@ -13,9 +13,9 @@ from __future__ import annotations
 
 import copy
 from contextlib import suppress
-from typing import TYPE_CHECKING, List, Literal, Sequence, cast
+from typing import TYPE_CHECKING, List, Literal, cast
 
-from docx2python.attribute_register import Tags, get_prefixed_tag
+from docx2python.attribute_register import TAG_NAMES, Tags, get_prefixed_tag
 from docx2python.bullets_and_numbering import BulletGenerator
 from docx2python.depth_collector import DepthCollector, Par, get_par_strings
 from docx2python.forms import get_checkBox_entry, get_ddList_entry
@@ -31,6 +31,9 @@ if TYPE_CHECKING:
 ParsTable = List[List[List[List[Par]]]]
 TextTable = List[List[List[List[List[str]]]]]
 
+# elements which do not effect depth. See _get_elem_depth.
+_DEPTHLESS_TAGS = frozenset((Tags.DOCUMENT, Tags.BODY))
+
 
 def _get_elem_depth(tree: EtreeElement) -> Literal[1, 2, 3, 4] | None:
     """Return depth in a nested list, relative to paragraphs (depth 4).
@@ -74,23 +77,18 @@ def _get_elem_depth(tree: EtreeElement) -> Literal[1, 2, 3, 4] | None:
 
     There will only ever be one document list, so the min depth returned is 1
     """
-    if get_prefixed_tag(tree) in {Tags.DOCUMENT, Tags.BODY}:
+    if get_prefixed_tag(tree) in _DEPTHLESS_TAGS:
         return None
 
-    def search_at_depth(tree_: Sequence[EtreeElement], _depth: int = 0) -> int | None:
-        """Width-first recursive search for Tags.PARAGRAPH.
-
-        :param tree_: a sequence of elements which may contain a paragraph
-        :return: depth of the first paragraph found, or None if no paragraph found
-        """
-        if not tree_:
-            return None
-        if any(get_prefixed_tag(x) == Tags.PARAGRAPH for x in tree_):
-            return max(4 - _depth, 1)
-        grandchildren = [list(x) for x in tree_]
-        return search_at_depth([x for y in grandchildren for x in y], _depth + 1)
-
-    return cast(Literal[1, 2, 3, 4], search_at_depth([tree]))
+    # width-first search for Tags.PARAGRAPH, one level of descendants at a time
+    depth = 0
+    level: list[EtreeElement] = [tree]
+    while level:
+        if any(get_prefixed_tag(x) == Tags.PARAGRAPH for x in level):
+            return cast(Literal[1, 2, 3, 4], max(4 - depth, 1))
+        level = [x for y in level for x in y]
+        depth += 1
+    return None
 
 
 def _get_text_below(file: File, root: EtreeElement) -> str:
@@ -124,9 +122,8 @@ class TagRunner:
         self.tables.set_caret(tree_depth, tree)
 
         # not all tags are in the attribute register
-        try:
-            tag_name = Tags(get_prefixed_tag(tree)).name
-        except ValueError:
+        tag_name = TAG_NAMES.get(get_prefixed_tag(tree))
+        if tag_name is None:
             return True
 
         # not all tags have an open method
@@ -142,9 +139,8 @@ class TagRunner:
         tree_depth = _get_elem_depth(tree)
 
         # not all tags are in the attribute register
-        try:
-            tag_name = Tags(get_prefixed_tag(tree)).name
-        except ValueError:
+        tag_name = TAG_NAMES.get(get_prefixed_tag(tree))
+        if tag_name is None:
             self.tables.set_caret(tree_depth)
             return
 
@@ -334,7 +330,9 @@ class TagRunner:
             self.tables.set_caret(tree_depth)
             prev_tr = this_tbl[-2]
             tc_idx = len(this_tr) - 1
+            old_tc = this_tr[-1]
             this_tr[-1] = copy.deepcopy(prev_tr[tc_idx])
+            self.tables.count_merged_cell(this_tr[-1], old_tc)
 
         # horizontal merge. copy cell to the left. These will not exist yet. If
         # self.file.context.duplicate_merged_cells is False, insert an empty cell.
@@ -346,6 +344,7 @@ class TagRunner:
                 this_tr.append(copy.deepcopy(this_tr[-1]))
             else:
                 this_tr.append([Par.new_empty_par(None)])
+            self.tables.count_merged_cell(this_tr[-1], [])
 
 
 def new_depth_collector(file: File, root: EtreeElement | None = None) -> DepthCollector:
@@ -16,7 +16,7 @@ from __future__ import annotations
 from contextlib import suppress
 from typing import TYPE_CHECKING
 
-from docx2python.namespace import get_attrib_by_qn, iterfind_by_qn, qn
+from docx2python.namespace import find_by_qn, get_attrib_by_qn, iterfind_by_qn, qn
 
 if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement  # type: ignore
@@ -59,10 +59,10 @@ def get_checkBox_entry(checkBox: EtreeElement) -> str:
         with suppress(StopIteration):
             checked = next(iterfind_by_qn(checkBox, "w:checked"))
             return str(checked.attrib.get(qn(checked, "w:val")) or "1")
-        with suppress(StopIteration, KeyError):
-            default = next(iterfind_by_qn(checkBox, "w:default"))
-            return str(get_attrib_by_qn(default, "w:val"))
-        return None
+        default = find_by_qn(checkBox, "w:default")
+        if default is None:
+            return None
+        return default.get(qn(default, "w:val"))
 
     return {
         "0": "\u2610",
@@ -90,9 +90,6 @@ def get_ddList_entry(ddList: EtreeElement) -> str:
     list_entries = [
         get_attrib_by_qn(x, "w:val") for x in iterfind_by_qn(ddList, "w:listEntry")
     ]
-    try:
-        result = next(iterfind_by_qn(ddList, "w:result"))
-        list_index = int(get_attrib_by_qn(result, "w:val"))
-    except (StopIteration, KeyError):
-        list_index = 0
+    result = find_by_qn(ddList, "w:result")
+    list_index = 0 if result is None else int(result.get(qn(result, "w:val"), 0))
     return str(list_entries[list_index])
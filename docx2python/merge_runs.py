@@ -21,12 +21,15 @@ if TYPE_CHECKING:
     from docx2python.docx_reader import File
 
 # identify tags that will be merged together (if formatting is equivalent)
-_MERGEABLE_TAGS = {Tags.RUN, Tags.HYPERLINK, Tags.TEXT, Tags.TEXT_MATH}
+_MERGEABLE_TAGS = frozenset((Tags.RUN, Tags.HYPERLINK, Tags.TEXT, Tags.TEXT_MATH))
+
+# identify tags that can be treated as text
+_TEXT_TAGS = frozenset((Tags.TEXT, Tags.TEXT_MATH))
 
 
 def _is_mergeable(elem: EtreeElement) -> bool:
     """Can a run be merged with another run?"""
-    return elem.tag in _MERGEABLE_TAGS or get_prefixed_tag(elem) in _MERGEABLE_TAGS
+    return get_prefixed_tag(elem) in _MERGEABLE_TAGS
 
 
 def _elem_key(file: File, elem: EtreeElement) -> tuple[str, str, list[str]]:
@@ -68,8 +71,7 @@ def _elem_key(file: File, elem: EtreeElement) -> tuple[str, str, list[str]]:
 
 def _is_text_or_text_math(elem: EtreeElement) -> bool:
     """Can an element be treated as text?"""
-    text_or_text_math = {Tags.TEXT, Tags.TEXT_MATH}
-    return elem.tag in text_or_text_math or get_prefixed_tag(elem) in text_or_text_math
+    return get_prefixed_tag(elem) in _TEXT_TAGS
 
 
 def merge_elems(file: File, tree: EtreeElement) -> None:
@@ -118,11 +118,11 @@ def find_parent_by_qn(elem: EtreeElement | None, tag: str) -> EtreeElement | Non
     :param tag: namespace-prefixed tag, e.g. ``w:p``
     :return: parent element with the namespace-prefixed tag
     """
-    if elem is None:
-        return None
-    if get_prefixed_tag(elem) == tag:
-        return elem
-    return find_parent_by_qn(elem.getparent(), tag)
+    while elem is not None:
+        if get_prefixed_tag(elem) == tag:
+            return elem
+        elem = elem.getparent()
+    return None
 
 
 def iterfind_by_qn(elem: EtreeElement, tag: str) -> Iterator[EtreeElement]:
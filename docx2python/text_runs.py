@@ -9,6 +9,7 @@ those elements to extract formatting information.
 
 from __future__ import annotations
 
+import sys
 from collections import defaultdict
 from contextlib import suppress
 from typing import TYPE_CHECKING, Sequence
@@ -219,8 +220,11 @@ def _format_Pr_into_html(
     # con_pro2for[(con, pro)] = string created from for
     con_pro2for: defaultdict[tuple[None | str, None | str], list[str]]
     con_pro2for = defaultdict(list)
-    for tag, val in ((k, v) for k, v in Pr2val.items() if k in xml2html):
-        formatter, container, property_ = xml2html[tag]
+    for tag, val in Pr2val.items():
+        html_formatter = xml2html.get(tag)
+        if html_formatter is None:
+            continue
+        formatter, container, property_ = html_formatter
         con_pro2for[(container, property_)].append(formatter(tag, val or ""))
 
     # group together supported formats with the same container
@@ -237,7 +241,10 @@ def _format_Pr_into_html(
 
     # add back in formats with no container or property_
     style += sorted(con_pro2for[(None, None)])
-    return style
+
+    # many runs share a style, so share the strings, too. This also speeds up the
+    # style-tuple comparisons in depth_collector's html tag caches.
+    return [sys.intern(x) for x in style]
 
 
 def get_html_formatting(
@@ -253,9 +260,10 @@ def get_html_formatting(
         }
     :return: ``[(rPr, val), (rPr, val) ...]``
     """
-    if get_prefixed_tag(elem) == Tags.RUN:
+    prefixed_tag = get_prefixed_tag(elem)
+    if prefixed_tag == Tags.RUN:
         return get_run_formatting(elem, xml2html)
-    if get_prefixed_tag(elem) == Tags.PARAGRAPH:
+    if prefixed_tag == Tags.PARAGRAPH:
         return get_paragraph_formatting(elem, xml2html)
     return []
 
@@ -273,7 +281,7 @@ def html_open(style: Sequence[str]) -> str:
     return "".join(f"<{x}>" for x in style)
 
 
-def html_close(style: list[str]) -> str:
+def html_close(style: Sequence[str]) -> str:
     """HTML tags to close a style.
 
     :param style: sequence of html tags without the '<' and '>'
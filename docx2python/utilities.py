@@ -26,6 +26,10 @@ if TYPE_CHECKING:
     from lxml.etree import _Element as EtreeElement  # type: ignore
 
 
+_LINK_PATTERN = re.compile('<a href="(?P<href>[^"]+)">(?P<text>[^<]+)</a>')
+_HEADING_PATTERN = re.compile(r"Heading\d")
+
+
 def _copy_new_text(elem: EtreeElement, new_text: str) -> EtreeElement:
     """Copy a text element and replace text.
 
@@ -114,10 +118,9 @@ def get_links(path_in: str | os.PathLike[str]) -> Iterator[tuple[str, str]]:
     :yield: every link in the file as a tuple of (href, text)
     :return: None
     """
-    link_pattern = re.compile('<a href="(?P<href>[^"]+)">(?P<text>[^<]+)</a>')
     extraction = docx2python(path_in)
     for run in iter_at_depth(extraction.document_runs, 5):
-        match = re.match(link_pattern, run)
+        match = _LINK_PATTERN.match(run)
         if match:
             href, text = match.groups()
             yield href, text
@@ -135,8 +138,7 @@ def get_headings(path_in: str | os.PathLike[str]) -> Iterator[list[str]]:
     every paragraph will be a paragraph style extracted from the xml, if present.
     Else, paragraphs style will be "".
     """
-    heading_pattern = re.compile(r"Heading\d")
     with docx2python(path_in, html=True) as extraction:
         for par in iter_at_depth(extraction.document_pars, 4):
-            if re.match(heading_pattern, par.style):
+            if _HEADING_PATTERN.match(par.style):
                 yield par.run_strings
@@ -60,7 +60,7 @@ def valid_xml(elements: str) -> bytes:
     """Build a legal xml file from elements."""
     beg = _BEG_XML
     end = _END_XML
-    if elements.startswith("<w:p"):
+    if elements.startswith(("<w:p", "<w:tbl")):
         pass
     elif elements.startswith("<w:r"):
         beg += _BEG_PAR
@@ -0,0 +1,75 @@
+"""Test functions in docx2python.attribute_register.py
+
+:author: Shay Hill
+:created: 2026-10-16
+"""
+
+# pyright: reportPrivateUsage=false
+
+import pytest
+from lxml import etree
+
+from docx2python.attribute_register import (
+    _LOCALNAME_CACHE,
+    get_localname,
+    get_prefixed_tag,
+    has_content,
+)
+from tests.helpers.utils import valid_xml
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+DOCUMENT = etree.fromstring(
+    valid_xml(
+        "<w:p>"
+        + "<w:pPr><w:pStyle w:val='Heading1'/></w:pPr>"
+        + "<w:proofErr w:type='spellStart'/>"
+        + "<w:ins><w:r><w:t>inserted</w:t></w:r></w:ins>"
+        + "<w:bookmarkStart><w:p/></w:bookmarkStart>"
+        + "</w:p>"
+    )
+)
+
+
+class TestHasContent:
+    """Test attribute_register.has_content"""
+
+    def test_content_element(self) -> None:
+        """Return the tag of a content element."""
+        paragraph = DOCUMENT[0][0]
+        assert has_content(paragraph) == f"{W_NS}p"
+
+    def test_no_content(self) -> None:
+        """Return None for properties and other ignored elements."""
+        paragraph = DOCUMENT[0][0]
+        assert has_content(paragraph[0]) is None
+        assert has_content(paragraph[1]) is None
+
+    def test_content_below(self) -> None:
+        """Return the tag of the first content element beneath an ignored element."""
+        paragraph = DOCUMENT[0][0]
+        assert has_content(paragraph[2]) == f"{W_NS}r"
+        assert has_content(paragraph[3]) == f"{W_NS}p"
+
+
+class TestGetLocalname:
+    """Test attribute_register.get_localname and get_prefixed_tag"""
+
+    def test_localname(self) -> None:
+        """Strip the namespace uri from a tag. Cache the result for a str tag."""
+        paragraph = DOCUMENT[0][0]
+        assert get_localname(paragraph) == "p"
+        assert _LOCALNAME_CACHE[f"{W_NS}p"] == "p"
+        assert get_localname(paragraph) == "p"
+        assert get_prefixed_tag(paragraph) == "w:p"
+
+    def test_no_namespace(self) -> None:
+        """Return a tag without a namespace uri as is."""
+        assert get_localname(etree.Element("p")) == "p"
+
+    def test_invalid_tag(self) -> None:
+        """Warn each time an invalid tag is encountered."""
+        comment = etree.Comment("comment")
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="skipping invalid tag name"):
+                assert get_localname(comment).startswith("FAILED-")
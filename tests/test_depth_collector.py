@@ -0,0 +1,122 @@
+"""Test how DepthCollector opens and closes runs.
+
+Runs are created lazily. A concluded run, or a run interrupted by a hyperlink, leaves
+a pending style, and a new run is only created if text arrives.
+
+:author: Shay Hill
+:created: 2026-10-16
+"""
+
+# pyright: reportPrivateUsage=false
+
+from __future__ import annotations
+
+from typing import Iterator
+
+import pytest
+from lxml import etree
+
+from docx2python.depth_collector import DepthCollector, Run
+from docx2python.docx_reader import DocxReader, File
+from docx2python.docx_text import new_depth_collector
+from tests.conftest import RESOURCES
+from tests.helpers.utils import valid_xml
+
+BOLD_RUN = etree.fromstring(valid_xml("<w:r><w:rPr><w:b/></w:rPr></w:r>"))[0][0][0]
+
+TEXTBOX_INSIDE_BOLD_RUN = valid_xml(
+    "<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>a</w:t><w:tab/>"
+    + "<w:pict><v:shape><v:textbox><w:txbxContent>"
+    + "<w:p><w:r><w:t>inner</w:t></w:r></w:p>"
+    + "</w:txbxContent></v:textbox></v:shape></w:pict>"
+    + "<w:t>b</w:t></w:r></w:p>"
+)
+
+
+@pytest.fixture()
+def file() -> Iterator[File]:
+    """A File whose context converts xml styles to html."""
+    context = DocxReader(RESOURCES / "example.docx", html=True)
+    yield context.file_of_type("officeDocument")
+    context.close()
+
+
+@pytest.fixture()
+def collector(file: File) -> DepthCollector:
+    """An empty DepthCollector that converts xml styles to html."""
+    return DepthCollector(file)
+
+
+class TestLazyRuns:
+    """Runs after a concluded or interrupted run are only created for text."""
+
+    def test_pending_style_without_text(self, collector: DepthCollector) -> None:
+        """A style set with no following text does not produce an empty run."""
+        par = collector.commence_paragraph()
+        collector.commence_run(BOLD_RUN)
+        collector.add_text_into_open_run("text")
+        collector.insert_text_as_new_run("link")
+        collector.conclude_run()
+        collector.conclude_paragraph()
+        assert par.runs == [Run(["b"], "text"), Run([], "link")]
+
+    def test_styled_text_after_unstyled_run(self, collector: DepthCollector) -> None:
+        """Text after a run inserted mid-run keeps the style of the interrupted run."""
+        par = collector.commence_paragraph()
+        collector.commence_run(BOLD_RUN)
+        collector.add_text_into_open_run("some text")
+        collector.insert_text_as_new_run("link")
+        collector.add_text_into_open_run("other text")
+        collector.conclude_run()
+        collector.conclude_paragraph()
+        assert par.runs == [
+            Run(["b"], "some text"),
+            Run([], "link"),
+            Run(["b"], "other text"),
+        ]
+        assert par.run_strings == ["<b>some text</b>", "link", "<b>other text</b>"]
+
+    def test_styled_run_after_concluded_run(self, collector: DepthCollector) -> None:
+        """A styled run commenced after a concluded run keeps its own style."""
+        par = collector.commence_paragraph()
+        collector.commence_run()
+        collector.add_text_into_open_run("plain")
+        collector.conclude_run()
+        collector.commence_run(BOLD_RUN)
+        collector.add_text_into_open_run("bold")
+        collector.conclude_run()
+        collector.conclude_paragraph()
+        assert par.runs == [Run([], "plain"), Run(["b"], "bold")]
+
+    def test_conclude_run_without_paragraph(self, collector: DepthCollector) -> None:
+        """Concluding a run with no open paragraph opens a paragraph and a run."""
+        collector.conclude_run()
+        assert len(collector._open_pars) == 1
+        collector.add_text_into_open_run("text")
+        collector.conclude_paragraph()
+        assert collector.tree_text == [[[[["text"]]]]]
+
+    def test_nested_paragraph_after_concluded_run(
+        self, collector: DepthCollector
+    ) -> None:
+        """Text after a concluded run and a nested paragraph starts a new run."""
+        par = collector.commence_paragraph()
+        collector.commence_run(BOLD_RUN)
+        collector.add_text_into_open_run("a")
+        collector.conclude_run()
+        inner = collector.commence_paragraph()
+        collector.add_text_into_open_run("inner")
+        collector.conclude_paragraph()
+        collector.add_text_into_open_run("b")
+        collector.conclude_paragraph()
+        assert inner.runs == [Run([], "inner")]
+        assert par.runs == [Run(["b"], "a"), Run([], "b")]
+
+    def test_nested_paragraph_after_inserted_run(self, file: File) -> None:
+        """A paragraph nested in a run does not reset the outer pending style."""
+        tables = new_depth_collector(file, etree.fromstring(TEXTBOX_INSIDE_BOLD_RUN))
+        assert tables.tree_text == [
+            [[[]]],
+            [[[["inner"]]]],
+            [[[["<b>a</b>", "\t", "<b>b</b>"]]]],
+        ]
@@ -4,8 +4,12 @@
 :created: 4/3/2021
 """
 
+# pyright: reportPrivateUsage=false
+
+import pytest
+
 from docx2python.attribute_register import Tags, get_prefixed_tag
-from docx2python.docx_reader import DocxReader
+from docx2python.docx_reader import DocxReader, _infer_path, _infer_rels_path
 from docx2python.main import docx2python
 from tests.conftest import RESOURCES
 
@@ -45,3 +49,35 @@ class TestFileObject:
         )
         context.close()
         full_extraction.close()
+
+
+class TestInferPath:
+    """Infer archive paths from rels directories and Targets."""
+
+    @pytest.mark.parametrize(
+        ("dir_", "target", "path"),
+        [
+            ("_rels", "word/document.xml", "word/document.xml"),
+            ("word/_rels", "header1.xml", "word/header1.xml"),
+            ("word/_rels", "media/image1.png", "word/media/image1.png"),
+            ("word/_rels", "../customXml/item1.xml", "word/customXml/item1.xml"),
+            ("_rels", "/word/document.xml", "word/document.xml"),
+            ("", "document.xml", "/document.xml"),
+            ("word/_rels", "https://www.example.com/", "word/https:/www.example.com"),
+            ("word/_rels", "./x.xml", "word/x.xml"),
+            ("word/_rels", "a/./b.xml", "word/a/b.xml"),
+            ("word/_rels", "x.xml/.", "word/x.xml"),
+            ("word/_rels", "./media/./image1.png", "word/media/image1.png"),
+        ],
+    )
+    def test_infer_path(self, dir_: str, target: str, path: str) -> None:
+        """Match the paths previously inferred with pathlib."""
+        assert _infer_path(dir_, target) == path
+
+    def test_infer_rels_path(self) -> None:
+        """Insert _rels directory and append .rels suffix."""
+        assert _infer_rels_path("word/header1.xml") == "word/_rels/header1.xml.rels"
+
+    def test_infer_rels_path_rooted(self) -> None:
+        """Keep the root of a rooted path, as os.path.split did."""
+        assert _infer_rels_path("/document.xml") == "//_rels/document.xml.rels"
@@ -4,8 +4,15 @@
 :created: 2023-01-23
 """
 
+import pytest
+from lxml import etree
+
 from docx2python import docx2python
+from docx2python.docx_reader import DocxReader
+from docx2python.docx_text import new_depth_collector
+from docx2python.iterators import enum_at_depth
 from tests.conftest import RESOURCES
+from tests.helpers.utils import valid_xml
 
 
 class TestMergedCells:
@@ -42,3 +49,48 @@ class TestMergedCells:
                 [[[""]]],
             ]
             # fmt: on
+
+
+def _tc(text: str, tcPr: str = "") -> str:
+    """Build a table cell with one paragraph of text."""
+    run = f"<w:r><w:t>{text}</w:t></w:r>" if text else ""
+    return f"<w:tc><w:tcPr>{tcPr}</w:tcPr><w:p>{run}</w:p></w:tc>"
+
+
+MERGED_CELLS_THEN_COMMENT = valid_xml(
+    "<w:tbl>"
+    + "<w:tr>"
+    + _tc("0-01", '<w:gridSpan w:val="2"/>')
+    + _tc("0-2")
+    + "</w:tr><w:tr>"
+    + _tc("12-0", '<w:vMerge w:val="restart"/>')
+    + _tc("1-1")
+    + _tc("1-2")
+    + "</w:tr><w:tr>"
+    + _tc("", "<w:vMerge/>")
+    + _tc("2-1")
+    + _tc("2-2")
+    + "</w:tr>"
+    + "</w:tbl>"
+    + "<w:p><w:r><w:t>before</w:t></w:r>"
+    + '<w:commentRangeStart w:id="0"/>'
+    + "<w:r><w:t>commented</w:t></w:r>"
+    + '<w:commentRangeEnd w:id="0"/>'
+    + "<w:r><w:t>after</w:t></w:r></w:p>"
+)
+
+
+@pytest.mark.parametrize("duplicate_merged_cells", [True, False])
+def test_comment_range_after_merged_cells(duplicate_merged_cells: bool) -> None:
+    """Comment ranges after merged cells count the runs copied into those cells."""
+    reader = DocxReader(
+        RESOURCES / "example.docx", duplicate_merged_cells=duplicate_merged_cells
+    )
+    file = reader.file_of_type("officeDocument")
+    tables = new_depth_collector(file, etree.fromstring(MERGED_CELLS_THEN_COMMENT))
+    reader.close()
+
+    all_runs = [y for _, y in enum_at_depth(tables.tree_text, 5)]
+    beg, end = tables.comment_ranges["0"]
+    assert all_runs[beg:end] == ["commented"]
+    assert all_runs[:beg][-1] == "before"